@@ -4,6 +4,9 @@ setup(
     name="quantum_ledger",
     version="0.1.0",
     packages=find_packages(),
+    package_data={
+        "tools.data_generation": ["config.yaml"],
+    },
     install_requires=[
         # runtime dependencies, copiate da requirements.txt
         "numpy>=1.21.0",
@@ -11,4 +14,9 @@ setup(
         "matplotlib>=3.7.0",
         "pyyaml>=6.0",
     ],
+    entry_points={
+        "console_scripts": [
+            "generate-benchmark-data = tools.scripts.generate_benchmark_data:main",
+        ],
+    },
 )
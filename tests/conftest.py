@@ -0,0 +1,79 @@
+"""
+Shared pytest fixtures for the test suite.
+
+The generation config is identical for every test module, so it is
+loaded once per session instead of once per module.
+"""
+
+import functools
+import os
+
+import numpy as np
+import pytest
+import yaml
+
+try:
+    # libyaml-backed loader, 5-10x faster than the pure-Python SafeLoader
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+CONFIG_PATH = "tools/data_generation/config.yaml"
+
+# Sample columns holding strings rather than numbers
+STR_COLS = {"crypto_mode", "load_profile", "run_id"}
+
+
+def as_columns(samples):
+    """Convert a list of sample dicts to columnar NumPy arrays.
+
+    One pass over the samples instead of a list comprehension per metric;
+    tests can then assert with arr.mean(), np.diff(), np.unique() etc.
+    """
+    return {
+        k: np.fromiter(
+            (s[k] for s in samples),
+            dtype=object if k in STR_COLS else np.float64,
+            count=len(samples),
+        )
+        for k in samples[0].keys()
+    }
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime_ns: int, size: int) -> dict:
+    with open(path) as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def _load_config(path: str) -> dict:
+    # Key the cache by (path, mtime, size) so an edited config is re-parsed
+    # while repeated loads of the same file hit the cache.
+    st = os.stat(path)
+    return _load_config_cached(path, st.st_mtime_ns, st.st_size)
+
+
+@pytest.fixture(scope="session")
+def config():
+    """Load configuration from config.yaml (parsed once per session)
+
+    The cached dict is returned directly (no deepcopy): tests treat the
+    config as read-only.
+    """
+    return _load_config(CONFIG_PATH)
+
+
+@pytest.fixture(scope="module")
+def module_output_dir(tmp_path_factory):
+    """Module-scoped output directory for read-only exported artifacts."""
+    return str(tmp_path_factory.mktemp("exports"))
+
+
+@pytest.fixture
+def temp_output_dir(tmp_path):
+    """Per-test output directory under pytest's managed temp root.
+
+    pytest reuses one session root and prunes old ones itself, so tests
+    skip the mkdtemp/rmtree syscall churn of manual temp directories.
+    """
+    return str(tmp_path)
@@ -1,13 +1,8 @@
 # tests/unit/tools/data_generation/test_distributions.py
 import pytest
-import yaml
 from tools.data_generation import distributions
 
-# Fixture per caricare il config una sola volta
-@pytest.fixture(scope="module")
-def config():
-    with open("tools/data_generation/config.yaml") as f:
-        return yaml.safe_load(f)
+# Il fixture `config` (scope session) è definito in tests/conftest.py
 
 @pytest.fixture(scope="module")
 def load_profile(config):
@@ -92,3 +87,5 @@ def test_random_seed_reproducibility(load_profile):
     distributions.set_random_seed(42)
     val2 = distributions.generate_tx_rate(load_profile)
     assert val1 == val2, "Random seed not working"
+    # Re-seed from entropy so the fixed seed does not leak into later tests
+    distributions.set_random_seed(None)
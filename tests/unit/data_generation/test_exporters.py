@@ -11,11 +11,9 @@ Test coverage:
 """
 
 import pytest
-import yaml
 import csv
+import gzip
 import os
-import tempfile
-import shutil
 from pathlib import Path
 from tools.data_generation import exporters, samplers
 
@@ -24,21 +22,9 @@ from tools.data_generation import exporters, samplers
 # FIXTURES
 # ==============================================================================
 
-@pytest.fixture(scope="module")
-def config():
-    """Load configuration from config.yaml"""
-    with open("tools/data_generation/config.yaml") as f:
-        return yaml.safe_load(f)
-
-
-@pytest.fixture
-def temp_output_dir():
-    """Create a temporary output directory for tests"""
-    temp_dir = tempfile.mkdtemp(prefix="test_export_")
-    yield temp_dir
-    # Cleanup after test
-    shutil.rmtree(temp_dir, ignore_errors=True)
+# The session-scoped `config` fixture lives in tests/conftest.py
 
+# `temp_output_dir` comes from tests/conftest.py (pytest-managed tmp dir)
 
 @pytest.fixture
 def exporter(config, temp_output_dir):
@@ -46,7 +32,7 @@ def exporter(config, temp_output_dir):
     return exporters.CSVExporter(config, output_dir=temp_output_dir)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_data(config):
     """Generate sample data for testing"""
     sampler = samplers.BenchmarkSampler(
@@ -58,7 +44,7 @@ def sample_data(config):
     return sampler.generate_samples(10)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def multi_run_data(config):
     """Generate multi-run sample data"""
     multi_sampler = samplers.MultiRunSampler(
@@ -74,27 +60,37 @@ def multi_run_data(config):
 # TEST: CSV EXPORT UTILITIES 
 # ==============================================================================
 
-def test_export_run_with_csvexporter(sample_data, temp_output_dir, config):
+@pytest.fixture(scope="module")
+def exported_csv(sample_data, module_output_dir, config):
+    """Export once per module and parse once; read-only for the tests below."""
+    exporter = exporters.CSVExporter(config, output_dir=module_output_dir)
+    result = exporter.export_run(sample_data, "ECDSA", "LOWLOAD", 1)
+    with open(result.path, newline='') as f:
+        rows = list(csv.DictReader(f))
+    return exporter, result, rows
+
+
+def test_export_run_with_csvexporter(exported_csv):
     """Test exporting a single run using CSVExporter only"""
-    exporter = exporters.CSVExporter(config, output_dir=temp_output_dir)
-    filepath = exporter.export_run(sample_data, "ECDSA", "LOWLOAD", 1)
+    _, result, _ = exported_csv
     
-    assert os.path.exists(filepath)
-    assert os.path.basename(filepath) == "ECDSA_LOWLOAD_RUN1.csv"
+    # stat comes back with the result: stronger than exists() (catches empty files)
+    assert result.stat.st_size > 0
+    assert os.path.basename(result.path) == "ECDSA_LOWLOAD_RUN1.csv"
 
 
-def test_export_run_auto_columns(sample_data, temp_output_dir, config):
-    """Test export with automatic column detection via CSVExporter"""
-    exporter = exporters.CSVExporter(config, output_dir=temp_output_dir)
-    filepath = exporter.export_run(sample_data, "DILITHIUM3", "HIGHLOAD", 2)
-    
-    # Read back CSV
-    with open(filepath, 'r') as f:
-        reader = csv.DictReader(f)
-        header = reader.fieldnames
+def test_export_run_columns(exported_csv):
+    """Test the exported header against the configured columns"""
+    exporter, _, rows = exported_csv
     
-    # Deve avere tutte le colonne dei sample
-    assert set(header) == set(exporter.columns)
+    # Deve avere tutte le colonne dei sample (sorted also catches duplicates)
+    assert sorted(rows[0].keys()) == sorted(exporter.columns)
+
+
+def test_export_run_row_count(exported_csv, sample_data):
+    """Test that every sample became exactly one CSV row"""
+    _, _, rows = exported_csv
+    assert len(rows) == len(sample_data)
 
 
 def test_export_multiple_runs_csvexporter(multi_run_data, temp_output_dir, config):
@@ -111,6 +107,47 @@ def test_export_multiple_runs_csvexporter(multi_run_data, temp_output_dir, confi
         assert os.path.exists(fpath)
 
 
+def test_export_multiple_runs_combined(multi_run_data, temp_output_dir, config):
+    """Test combined export: all runs in one CSV, discriminated by run_id"""
+    exporter = exporters.CSVExporter(config, output_dir=temp_output_dir)
+    created_files = exporter.export_multiple_runs(
+        multi_run_data,
+        crypto_mode="ECDSA",
+        load_profile="LOWLOAD",
+        combined=True
+    )
+    
+    assert len(created_files) == 1
+    assert os.path.basename(created_files[0]) == "ECDSA_LOWLOAD_ALLRUNS.csv"
+    
+    with open(created_files[0]) as f:
+        rows = list(csv.DictReader(f))
+    
+    assert len(rows) == sum(len(s) for s in multi_run_data.values())
+    assert {row["run_id"] for row in rows} == set(multi_run_data.keys())
+
+
+def test_validate_csv_file(exported_csv, config):
+    """Test header-only CSV validation"""
+    exporter, result, _ = exported_csv
+    
+    assert exporters.validate_csv_file(result.path, exporter.columns) is True
+    assert exporters.validate_csv_file(result.path, ["wrong", "columns"]) is False
+    assert exporters.validate_csv_file("does_not_exist.csv", exporter.columns) is False
+
+
+def test_export_samples_gzip(sample_data, temp_output_dir, config):
+    """Test gzip-compressed export round-trips"""
+    gzip_config = {**config, "output": {**config["output"], "compress": "gzip"}}
+    exporter = exporters.CSVExporter(gzip_config, output_dir=temp_output_dir)
+    filepath = exporter.export_samples(sample_data, "ECDSA_LOWLOAD_RUN1.csv")
+    
+    assert filepath.endswith(".csv.gz")
+    with gzip.open(filepath, 'rt', newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == len(sample_data)
+
+
 def test_filename_generation_only_csvexporter(config):
     """Test filename generation via CSVExporter only"""
     exporter = exporters.CSVExporter(config)
@@ -10,52 +10,54 @@ Test coverage:
 - Column ordering
 """
 
+import numpy as np
 import pytest
-import yaml
 from tools.data_generation import samplers
 
+from tests.conftest import as_columns
+
 
 # ==============================================================================
 # FIXTURES
 # ==============================================================================
+# The session-scoped `config` fixture lives in tests/conftest.py
 
-@pytest.fixture(scope="module")
-def config():
-    """Load configuration from config.yaml"""
-    with open("tools/data_generation/config.yaml") as f:
-        return yaml.safe_load(f)
-
+# Fixtures get dedicated seeded RNG streams so the range assertions are
+# deterministic and independent of draw order in other test modules.
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sampler_ecdsa_lowload(config):
     """Create a sampler for ECDSA + LOWLOAD"""
     return samplers.BenchmarkSampler(
         config,
         crypto_mode_name="ECDSA",
         load_profile_name="LOWLOAD",
-        run_id="RUN1"
+        run_id="RUN1",
+        rng=np.random.default_rng(1)
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sampler_dilithium_highload(config):
     """Create a sampler for DILITHIUM3 + HIGHLOAD"""
     return samplers.BenchmarkSampler(
         config,
         crypto_mode_name="DILITHIUM3",
         load_profile_name="HIGHLOAD",
-        run_id="RUN2"
+        run_id="RUN2",
+        rng=np.random.default_rng(2)
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sampler_hybrid_mediumload(config):
     """Create a sampler for HYBRID + MEDIUMLOAD"""
     return samplers.BenchmarkSampler(
         config,
         crypto_mode_name="HYBRID",
         load_profile_name="MEDIUMLOAD",
-        run_id="RUN3"
+        run_id="RUN3",
+        rng=np.random.default_rng(3)
     )
 
 
@@ -195,22 +197,30 @@ def test_samples_have_monotonic_timestamps(sampler_ecdsa_lowload):
     """Test that timestamps are monotonically increasing"""
     samples = sampler_ecdsa_lowload.generate_samples(10)
     
-    timestamps = [s["timestamp"] for s in samples]
+    cols = as_columns(samples)
     
     # Check monotonic increase
-    for i in range(len(timestamps) - 1):
-        assert timestamps[i+1] > timestamps[i], "Timestamps not monotonically increasing"
+    assert np.all(np.diff(cols["timestamp"]) > 0), "Timestamps not monotonically increasing"
 
 
 def test_samples_variability(sampler_ecdsa_lowload):
     """Test that samples have variability (not all identical)"""
     samples = sampler_ecdsa_lowload.generate_samples(10)
     
-    # Extract tx_rate from all samples
-    tx_rates = [s["tx_rate"] for s in samples]
+    cols = as_columns(samples)
     
     # Should have some variability
-    assert len(set(tx_rates)) > 1, "All tx_rate values are identical (no variability)"
+    assert np.unique(cols["tx_rate"]).size > 1, "All tx_rate values are identical (no variability)"
+
+
+def test_generate_samples_array(sampler_ecdsa_lowload):
+    """Test structured-array generation matches the dict layout"""
+    arr = sampler_ecdsa_lowload.generate_samples_array(10)
+    
+    assert arr.dtype == samplers.SAMPLE_DTYPE
+    assert len(arr) == 10
+    assert np.all(arr["crypto_mode"] == "ECDSA")
+    assert np.all(np.diff(arr["timestamp"]) > 0)
 
 
 # ==============================================================================
@@ -243,6 +253,19 @@ def test_validate_sample_invalid_cpu_util(sampler_ecdsa_lowload):
     assert sampler_ecdsa_lowload.validate_sample(sample) is False
 
 
+def test_validate_batch(sampler_ecdsa_lowload):
+    """validate_batch applies the same rules as validate_sample, vectorized"""
+    columns = sampler_ecdsa_lowload.generate_samples_columns(50)
+    assert sampler_ecdsa_lowload.validate_batch(columns) is True
+
+    broken = dict(columns)
+    broken["cpu_util"] = columns["cpu_util"] + 100
+    assert sampler_ecdsa_lowload.validate_batch(broken) is False
+
+    del broken["cpu_util"]
+    assert sampler_ecdsa_lowload.validate_batch(broken) is False
+
+
 def test_validate_sample_missing_column(sampler_ecdsa_lowload):
     """Test validation catches missing columns"""
     sample = sampler_ecdsa_lowload.generate_sample(0)
@@ -358,8 +381,8 @@ def test_dilithium_slower_than_ecdsa(config):
     samples_dilithium = sampler_dilithium.generate_samples(50)
     
     # Calculate averages
-    avg_verify_ecdsa = sum(s["sig_verify_time"] for s in samples_ecdsa) / 50
-    avg_verify_dilithium = sum(s["sig_verify_time"] for s in samples_dilithium) / 50
+    avg_verify_ecdsa = as_columns(samples_ecdsa)["sig_verify_time"].mean()
+    avg_verify_dilithium = as_columns(samples_dilithium)["sig_verify_time"].mean()
     
     # DILITHIUM3 should be at least 3x slower for verification
     assert avg_verify_dilithium > avg_verify_ecdsa * 2.5, \
@@ -374,8 +397,8 @@ def test_highload_higher_latency_than_lowload(config):
     samples_low = sampler_low.generate_samples(50)
     samples_high = sampler_high.generate_samples(50)
     
-    avg_latency_low = sum(s["latency_avg"] for s in samples_low) / 50
-    avg_latency_high = sum(s["latency_avg"] for s in samples_high) / 50
+    avg_latency_low = as_columns(samples_low)["latency_avg"].mean()
+    avg_latency_high = as_columns(samples_high)["latency_avg"].mean()
     
     assert avg_latency_high > avg_latency_low, \
         f"HIGHLOAD latency ({avg_latency_high:.1f}) not higher than LOWLOAD ({avg_latency_low:.1f})"
\ No newline at end of file
@@ -9,10 +9,7 @@ Test coverage:
 """
 
 import pytest
-import yaml
 import os
-import tempfile
-import shutil
 from pathlib import Path
 
 from tools.scripts import generate_benchmark_data
@@ -22,20 +19,9 @@ from tools.scripts import generate_benchmark_data
 # FIXTURES
 # ==============================================================================
 
-@pytest.fixture(scope="module")
-def config():
-    """Load configuration from config.yaml"""
-    with open("tools/data_generation/config.yaml") as f:
-        return yaml.safe_load(f)
-
-
-@pytest.fixture
-def temp_output_dir():
-    """Create a temporary output directory for tests"""
-    temp_dir = tempfile.mkdtemp(prefix="test_generate_")
-    yield temp_dir
-    shutil.rmtree(temp_dir, ignore_errors=True)
+# The session-scoped `config` fixture lives in tests/conftest.py
 
+# `temp_output_dir` comes from tests/conftest.py (pytest-managed tmp dir)
 
 @pytest.fixture
 def mock_args():
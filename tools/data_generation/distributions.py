@@ -9,10 +9,13 @@ Version: 0.1.0 (MVP - Draft)
 Strategy: Simple random generation with basic constraints.
          Correlations will be added in refinement phase.
 """
-import random
 from typing import Dict, Any
+
+import numpy as np
+
 from tools.data_generation.utils.validators import validate_range
-from tools.data_generation.utils.random_utils import set_random_seed
+from tools.data_generation.utils.random_utils import set_random_seed, get_rng
+from tools.data_generation.utils.numba_utils import HAS_NUMBA, njit, prange
 
 def generate_tx_rate(load_profile: Dict[str, Any], crypto_performance_factor: float = 1.0) -> float:
     """
@@ -35,7 +38,7 @@ def generate_tx_rate(load_profile: Dict[str, Any], crypto_performance_factor: fl
     variance = load_profile["variance"]
     
     # Generate value with normal distribution around target
-    value = random.gauss(target, target * variance)
+    value = get_rng().normal(target, target * variance)
     
     # Clamp to min/max bounds
     min_tps = load_profile["min_tps"]
@@ -71,7 +74,7 @@ def generate_latency_avg(
     mean_latency = base_latency * crypto_latency_overhead
     
     # Add random variation
-    value = random.gauss(mean_latency, mean_latency * variance)
+    value = get_rng().normal(mean_latency, mean_latency * variance)
     
     # Ensure positive and reasonable
     return max(10.0, value)
@@ -93,7 +96,7 @@ def generate_latency_p95(latency_avg: float, multiplier_mean: float = 2.0, multi
         Ensures latency_p95 >= latency_avg * 1.5 (from config validation rules)
     """
     # Generate multiplier with some variance
-    multiplier = random.gauss(multiplier_mean, multiplier_std)
+    multiplier = get_rng().normal(multiplier_mean, multiplier_std)
     
     # Clamp multiplier to validation rules (1.5x to 2.5x)
     multiplier = max(1.5, min(2.5, multiplier))
@@ -124,7 +127,7 @@ def generate_cpu_util(
     
     # Add noise
     noise_std = 3.0  # ±3% from config
-    value = random.gauss(mean_cpu, noise_std)
+    value = get_rng().normal(mean_cpu, noise_std)
     
     # Clamp to valid percentage range
     return max(20.0, min(95.0, value))
@@ -154,7 +157,7 @@ def generate_mem_util(
     
     # Add noise
     noise_std = 2.0  # ±2% from config
-    value = random.gauss(mean_mem, noise_std)
+    value = get_rng().normal(mean_mem, noise_std)
     
     # Clamp to valid range
     return max(30.0, min(80.0, value))
@@ -180,7 +183,7 @@ def generate_block_size(tx_rate: float, base: int = 1024, tx_rate_factor: float
     
     # Add noise
     noise_std = 50.0  # ±50 bytes
-    value = random.gauss(mean_size, noise_std)
+    value = get_rng().normal(mean_size, noise_std)
     
     # Clamp to valid range and convert to integer
     return int(max(500, min(2500, value)))
@@ -210,7 +213,7 @@ def generate_block_commit_time(
     
     # Add noise
     noise_std = 5.0  # ±5ms
-    value = random.gauss(mean_time, noise_std)
+    value = get_rng().normal(mean_time, noise_std)
     
     # Clamp to valid range
     return max(30.0, min(200.0, value))
@@ -236,7 +239,7 @@ def generate_sig_gen_time(crypto_mode: Dict[str, Any]) -> float:
     min_val = sig_gen_config["min"]
     max_val = sig_gen_config["max"]
     
-    value = random.gauss(mean, std)
+    value = get_rng().normal(mean, std)
     
     return max(min_val, min(max_val, value))
 
@@ -261,7 +264,7 @@ def generate_sig_verify_time(crypto_mode: Dict[str, Any]) -> float:
     min_val = sig_verify_config["min"]
     max_val = sig_verify_config["max"]
     
-    value = random.gauss(mean, std)
+    value = get_rng().normal(mean, std)
     
     return max(min_val, min(max_val, value))
 
@@ -287,6 +290,175 @@ def generate_timestamp(start_timestamp: float, sample_index: int, interval: floa
     return start_timestamp + (sample_index * interval)
 
 
+# ==============================================================================
+# BATCH (VECTORIZED) VARIANTS
+# ==============================================================================
+# NumPy counterparts of the scalar generators above: one vectorized draw per
+# metric instead of one Python-level RNG call per sample. Semantics (means,
+# variances, clamping bounds) match the scalar versions exactly.
+#
+# Metric draws use float32 throughout: ~7 significant digits comfortably
+# covers values exported at 3 decimals, halves memory traffic and doubles
+# SIMD lane count. Timestamps stay float64 (epoch seconds need the range).
+#
+# The scale-and-clamp step is factored into `_clamped_gauss`, which is
+# JIT-compiled when Numba is installed (fused single pass, no temporaries)
+# and falls back to an equivalent NumPy expression otherwise.
+
+if HAS_NUMBA:
+    # nogil lets the threaded multi-run path overlap kernel executions
+    @njit(cache=True, fastmath=True, parallel=True, nogil=True)
+    def _clamped_gauss(z, mean, std, lo, hi):
+        out = np.empty_like(z)
+        for i in prange(z.size):
+            v = mean + z[i] * std
+            if v < lo:
+                v = lo
+            elif v > hi:
+                v = hi
+            out[i] = v
+        return out
+
+    # Warm the kernel at import: the first real draw then skips JIT
+    # latency entirely (cache=True serves repeat runs from disk).
+    _clamped_gauss(np.zeros(1, dtype=np.float32), 0.0, 1.0, -1.0, 1.0)
+else:
+    def _clamped_gauss(z, mean, std, lo, hi):
+        out = mean + z * std
+        return np.clip(out, lo, hi, out=out)
+
+
+def generate_tx_rate_batch(
+    load_profile: Dict[str, Any],
+    num_samples: int,
+    crypto_performance_factor: float = 1.0,
+    rng: np.random.Generator = None
+) -> np.ndarray:
+    """Generate `num_samples` transaction rates (vectorized generate_tx_rate)."""
+    rng = rng if rng is not None else get_rng()
+    target = load_profile["target_tps"] * crypto_performance_factor
+    z = rng.standard_normal(num_samples, dtype=np.float32)
+    return _clamped_gauss(z, target, target * load_profile["variance"],
+                          float(load_profile["min_tps"]), float(load_profile["max_tps"]))
+
+
+def generate_latency_avg_batch(
+    load_profile: Dict[str, Any],
+    crypto_latency_overhead: float,
+    tx_rate: np.ndarray,
+    rng: np.random.Generator = None
+) -> np.ndarray:
+    """Generate average latencies, one per tx_rate sample."""
+    rng = rng if rng is not None else get_rng()
+    mean_latency = load_profile["latency_base"] * crypto_latency_overhead
+    variance = load_profile.get("latency_variance", 0.1)
+    z = rng.standard_normal(len(tx_rate), dtype=np.float32)
+    return _clamped_gauss(z, mean_latency, mean_latency * variance, 10.0, np.inf)
+
+
+def generate_latency_p95_batch(
+    latency_avg: np.ndarray,
+    multiplier_mean: float = 2.0,
+    multiplier_std: float = 0.25,
+    rng: np.random.Generator = None
+) -> np.ndarray:
+    """Generate p95 latencies from an array of average latencies."""
+    rng = rng if rng is not None else get_rng()
+    z = rng.standard_normal(len(latency_avg), dtype=np.float32)
+    return latency_avg * _clamped_gauss(z, multiplier_mean, multiplier_std, 1.5, 2.5)
+
+
+def generate_cpu_util_batch(
+    load_profile: Dict[str, Any],
+    crypto_cpu_overhead: float,
+    tx_rate: np.ndarray,
+    rng: np.random.Generator = None
+) -> np.ndarray:
+    """Generate CPU utilization percentages, one per tx_rate sample."""
+    rng = rng if rng is not None else get_rng()
+    mean_cpu = load_profile["cpu_base"] * crypto_cpu_overhead
+    z = rng.standard_normal(len(tx_rate), dtype=np.float32)
+    return _clamped_gauss(z, mean_cpu, 3.0, 20.0, 95.0)
+
+
+def generate_mem_util_batch(
+    load_profile: Dict[str, Any],
+    tx_rate: np.ndarray,
+    tx_rate_sensitivity: float = 0.04,
+    rng: np.random.Generator = None
+) -> np.ndarray:
+    """Generate memory utilization percentages, one per tx_rate sample."""
+    rng = rng if rng is not None else get_rng()
+    mean_mem = load_profile["mem_base"] + (tx_rate / 100.0) * tx_rate_sensitivity * 100
+    values = mean_mem + rng.standard_normal(len(tx_rate), dtype=np.float32) * 2.0
+    return np.clip(values, 30.0, 80.0, out=values)
+
+
+def generate_block_size_batch(
+    tx_rate: np.ndarray,
+    base: int = 1024,
+    tx_rate_factor: float = 1.5,
+    rng: np.random.Generator = None
+) -> np.ndarray:
+    """Generate block sizes (bytes, integer), one per tx_rate sample."""
+    rng = rng if rng is not None else get_rng()
+    mean_size = base + (tx_rate / 100.0) * tx_rate_factor * 100
+    values = mean_size + rng.standard_normal(len(tx_rate), dtype=np.float32) * 50.0
+    return np.clip(values, 500, 2500, out=values).astype(np.int32)
+
+
+def generate_block_commit_time_batch(
+    block_size: np.ndarray,
+    crypto_overhead_factor: float,
+    base: float = 50.0,
+    block_size_sensitivity: float = 0.08,
+    rng: np.random.Generator = None
+) -> np.ndarray:
+    """Generate block commit times (ms), one per block_size sample."""
+    rng = rng if rng is not None else get_rng()
+    block_kb = block_size / 1024.0
+    mean_time = base + (block_kb * block_size_sensitivity * 1000) + (crypto_overhead_factor * 10)
+    values = mean_time + rng.standard_normal(len(block_size), dtype=np.float32) * 5.0
+    return np.clip(values, 30.0, 200.0, out=values)
+
+
+def _generate_sig_time_batch(timing_config: Dict[str, Any], num_samples: int,
+                             rng: np.random.Generator = None) -> np.ndarray:
+    """Draw clamped normal signature timings from a {mean,std,min,max} config."""
+    rng = rng if rng is not None else get_rng()
+    z = rng.standard_normal(num_samples, dtype=np.float32)
+    return _clamped_gauss(z, float(timing_config["mean"]), float(timing_config["std"]),
+                          float(timing_config["min"]), float(timing_config["max"]))
+
+
+def generate_sig_gen_time_batch(crypto_mode: Dict[str, Any], num_samples: int,
+                                rng: np.random.Generator = None) -> np.ndarray:
+    """Generate `num_samples` signature generation times (μs)."""
+    return _generate_sig_time_batch(crypto_mode["sig_gen_time"], num_samples, rng)
+
+
+def generate_sig_verify_time_batch(crypto_mode: Dict[str, Any], num_samples: int,
+                                   rng: np.random.Generator = None) -> np.ndarray:
+    """Generate `num_samples` signature verification times (μs)."""
+    return _generate_sig_time_batch(crypto_mode["sig_verify_time"], num_samples, rng)
+
+
+# Single-slot memo for the timestamp offset vector. Within one sweep
+# every run shares (num_samples, interval), so the arange-times-interval
+# product is computed once and only the per-run start shift remains.
+_timestamp_offsets = (None, None)  # ((num_samples, interval), offsets)
+
+
+def generate_timestamps(start_timestamp: float, num_samples: int, interval: float = 1.0) -> np.ndarray:
+    """Generate `num_samples` monotonically increasing timestamps."""
+    global _timestamp_offsets
+    key = (num_samples, interval)
+    cached_key, offsets = _timestamp_offsets
+    if cached_key != key:
+        offsets = np.arange(num_samples, dtype=np.float64) * interval
+        offsets.setflags(write=False)
+        _timestamp_offsets = (key, offsets)
+    return start_timestamp + offsets
 
 
 # ==============================================================================
@@ -304,6 +476,17 @@ __all__ = [
     "generate_sig_gen_time",
     "generate_sig_verify_time",
     "generate_timestamp",
+    "generate_tx_rate_batch",
+    "generate_latency_avg_batch",
+    "generate_latency_p95_batch",
+    "generate_cpu_util_batch",
+    "generate_mem_util_batch",
+    "generate_block_size_batch",
+    "generate_block_commit_time_batch",
+    "generate_sig_gen_time_batch",
+    "generate_sig_verify_time_batch",
+    "generate_timestamps",
     "validate_range",
     "set_random_seed",
+    "get_rng",
 ]
\ No newline at end of file
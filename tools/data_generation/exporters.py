@@ -6,15 +6,19 @@ This module is a wrapper around CSV utilities and CSVExporter class.
 
 from tools.data_generation.utils.csv_utils import (
     CSVExporter,
+    ExportResult,
     format_value,
     get_quoting_constant,
-    generate_filename
+    generate_filename,
+    validate_csv_file
 )
 
 
 __all__ = [
     "CSVExporter",
+    "ExportResult",
     "format_value",
     "get_quoting_constant",
     "generate_filename",
+    "validate_csv_file",
 ]
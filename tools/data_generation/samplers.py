@@ -10,10 +10,80 @@ Strategy: Generate one complete row at a time with basic parameter passing.
          Advanced correlations will be added in refinement phase.
 """
 
-from typing import Dict, Any, List
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+from typing import Dict, Any, Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
 from . import distributions
 
 
+# Columnar (struct-of-arrays) sample layout: one contiguous typed column per
+# metric instead of one dict per row. Produced by generate_samples_array.
+SAMPLE_DTYPE = np.dtype([
+    ("timestamp", "f8"),   # epoch seconds need float64 range
+    ("crypto_mode", "U16"),
+    ("load_profile", "U16"),
+    ("run_id", "U8"),
+    ("tx_rate", "f4"),
+    ("latency_avg", "f4"),
+    ("latency_p95", "f4"),
+    ("cpu_util", "f4"),
+    ("mem_util", "f4"),
+    ("block_size", "i4"),
+    ("block_commit_time", "f4"),
+    ("sig_gen_time", "f4"),
+    ("sig_verify_time", "f4"),
+])
+
+
+class SamplerParams(NamedTuple):
+    """Resolved per-(crypto_mode, load_profile) configuration slice.
+
+    `config` is kept in the tuple so the id()-based cache key below cannot
+    alias a garbage-collected dict.
+    """
+    config: Dict[str, Any]
+    crypto_mode: Dict[str, Any]
+    load_profile: Dict[str, Any]
+    performance_factor: float
+    latency_overhead: float
+    cpu_overhead: float
+
+
+_params_cache: Dict[tuple, SamplerParams] = {}
+
+
+def _resolve_params(
+    config: Dict[str, Any],
+    crypto_mode_name: str,
+    load_profile_name: str
+) -> SamplerParams:
+    """Memoize config-dict traversal per (config, crypto mode, load profile).
+
+    Re-instantiating samplers for the same experiment matrix (every run,
+    every export) re-walked the nested config; this resolves each
+    combination once.
+    """
+    key = (id(config), crypto_mode_name, load_profile_name)
+    params = _params_cache.get(key)
+    if params is None or params.config is not config:
+        crypto_mode = config["crypto_modes"][crypto_mode_name]
+        load_profile = config["load_profiles"][load_profile_name]
+        params = SamplerParams(
+            config,
+            crypto_mode,
+            load_profile,
+            crypto_mode["performance_factor"],
+            crypto_mode["latency_overhead"],
+            crypto_mode["cpu_overhead"],
+        )
+        _params_cache[key] = params
+    return params
+
+
 class BenchmarkSampler:
     """
     Generates complete benchmark data samples for PQC Hyperledger Fabric.
@@ -35,7 +105,8 @@ class BenchmarkSampler:
         crypto_mode_name: str,
         load_profile_name: str,
         run_id: str,
-        start_timestamp: float = None
+        start_timestamp: float = None,
+        rng: Optional[np.random.Generator] = None
     ):
         """
         Initialize the sampler with configuration and experiment parameters.
@@ -46,6 +117,7 @@ class BenchmarkSampler:
             load_profile_name: "LOWLOAD", "MEDIUMLOAD", "HIGHLOAD", or "SUSTAINED"
             run_id: Run identifier (e.g., "RUN1")
             start_timestamp: Starting timestamp (if None, uses config default)
+            rng: Optional dedicated RNG stream (defaults to the shared one)
         
         Raises:
             KeyError: If crypto_mode_name or load_profile_name not in config
@@ -55,14 +127,13 @@ class BenchmarkSampler:
         self.load_profile_name = load_profile_name
         self.run_id = run_id
         
-        # Extract crypto mode and load profile configurations
-        self.crypto_mode = config["crypto_modes"][crypto_mode_name]
-        self.load_profile = config["load_profiles"][load_profile_name]
-        
-        # Extract performance factors
-        self.crypto_performance_factor = self.crypto_mode["performance_factor"]
-        self.crypto_latency_overhead = self.crypto_mode["latency_overhead"]
-        self.crypto_cpu_overhead = self.crypto_mode["cpu_overhead"]
+        # Resolve crypto mode / load profile configuration (memoized)
+        params = _resolve_params(config, crypto_mode_name, load_profile_name)
+        self.crypto_mode = params.crypto_mode
+        self.load_profile = params.load_profile
+        self.crypto_performance_factor = params.performance_factor
+        self.crypto_latency_overhead = params.latency_overhead
+        self.crypto_cpu_overhead = params.cpu_overhead
         
         # Timestamp configuration
         if start_timestamp is None:
@@ -72,8 +143,26 @@ class BenchmarkSampler:
         
         self.sampling_interval = config["sampling"]["interval"]
         
-        # Metric configuration
+        # Metric configuration; the nested values used on the draw path
+        # are unpacked once here so per-draw code does no dict traversal
+        # (generate_sample callers hit that path once per row).
         self.metrics_config = config["metrics"]
+        metrics = self.metrics_config
+        self._p95_mult_mean = metrics["latency_p95"]["multiplier_mean"]
+        self._p95_mult_std = metrics["latency_p95"]["multiplier_std"]
+        self._mem_tx_sensitivity = metrics["mem_util"]["tx_rate_sensitivity"]
+        self._block_size_base = metrics["block_size"]["base"]
+        self._block_tx_factor = metrics["block_size"]["tx_rate_factor"]
+        self._commit_overhead_factor = metrics["block_commit_time"]["crypto_overhead_factor"]
+        self._commit_base = metrics["block_commit_time"]["base"]
+        self._commit_size_sensitivity = metrics["block_commit_time"]["block_size_sensitivity"]
+
+        # Dedicated RNG stream (None = shared module-level generator)
+        self._rng = rng
+
+        # Frozen column set: validate_sample does one C-level set
+        # comparison instead of re-reading the config per call.
+        self._columns_frozen = frozenset(config["output"]["columns"])
     
     def generate_sample(self, sample_index: int) -> Dict[str, Any]:
         """
@@ -94,73 +183,93 @@ class BenchmarkSampler:
             >>> row.keys()
             dict_keys(['timestamp', 'crypto_mode', 'load_profile', 'run_id', 'tx_rate', ...])
         """
-        # Generate timestamp
+        # Single-element draw through the same vectorized path as
+        # generate_samples; only the timestamp depends on the index.
+        metrics = self._draw_metric_arrays(1)
         timestamp = distributions.generate_timestamp(
-            self.start_timestamp, 
-            sample_index, 
+            self.start_timestamp,
+            sample_index,
             self.sampling_interval
         )
+
+        sample = self._assemble_sample(metrics, 0)
+        sample["timestamp"] = timestamp
+        return sample
+    
+    def generate_samples(self, num_samples: int) -> List[Dict[str, Any]]:
+        """
+        Generate multiple data samples (multiple CSV rows).
         
-        # Generate transaction rate
-        tx_rate = distributions.generate_tx_rate(
-            self.load_profile,
-            self.crypto_performance_factor
-        )
+        Args:
+            num_samples: Number of samples to generate
         
-        # Generate latency metrics (dependent on tx_rate and crypto mode)
-        latency_avg = distributions.generate_latency_avg(
-            self.load_profile,
-            self.crypto_latency_overhead,
-            tx_rate
+        Returns:
+            List of sample dictionaries
+            
+        Example:
+            >>> sampler = BenchmarkSampler(config, "ECDSA", "LOWLOAD", "RUN1")
+            >>> samples = sampler.generate_samples(300)  # 5 minutes at 1 sample/sec
+            >>> len(samples)
+            300
+
+        Note:
+            All metrics are drawn as vectorized NumPy batches (one RNG call
+            per metric instead of one per sample); the list-of-dicts layout
+            is only assembled at the return boundary.
+        """
+        metrics = self._draw_metric_arrays(num_samples)
+        return [self._assemble_sample(metrics, i) for i in range(num_samples)]
+
+    def _draw_metric_arrays(self, n: int) -> Dict[str, np.ndarray]:
+        """Draw all metric columns for `n` samples as NumPy arrays.
+
+        Shared by generate_sample (n=1) and generate_samples, so both go
+        through the same vectorized distributions.
+        """
+        timestamps = distributions.generate_timestamps(
+            self.start_timestamp, n, self.sampling_interval
         )
-        
-        latency_p95_config = self.metrics_config["latency_p95"]
-        latency_p95 = distributions.generate_latency_p95(
+        tx_rate = distributions.generate_tx_rate_batch(
+            self.load_profile, n, self.crypto_performance_factor, rng=self._rng
+        )
+        latency_avg = distributions.generate_latency_avg_batch(
+            self.load_profile, self.crypto_latency_overhead, tx_rate, rng=self._rng
+        )
+
+        latency_p95 = distributions.generate_latency_p95_batch(
             latency_avg,
-            latency_p95_config["multiplier_mean"],
-            latency_p95_config["multiplier_std"]
+            self._p95_mult_mean,
+            self._p95_mult_std,
+            rng=self._rng
         )
-        
-        # Generate resource utilization
-        cpu_util = distributions.generate_cpu_util(
-            self.load_profile,
-            self.crypto_cpu_overhead,
-            tx_rate
+
+        cpu_util = distributions.generate_cpu_util_batch(
+            self.load_profile, self.crypto_cpu_overhead, tx_rate, rng=self._rng
         )
-        
-        mem_util_config = self.metrics_config["mem_util"]
-        mem_util = distributions.generate_mem_util(
-            self.load_profile,
-            tx_rate,
-            mem_util_config["tx_rate_sensitivity"]
+
+        mem_util = distributions.generate_mem_util_batch(
+            self.load_profile, tx_rate, self._mem_tx_sensitivity,
+            rng=self._rng
         )
-        
-        # Generate block metrics
-        block_size_config = self.metrics_config["block_size"]
-        block_size = distributions.generate_block_size(
-            tx_rate,
-            block_size_config["base"],
-            block_size_config["tx_rate_factor"]
+
+        block_size = distributions.generate_block_size_batch(
+            tx_rate, self._block_size_base, self._block_tx_factor,
+            rng=self._rng
         )
-        
-        block_commit_config = self.metrics_config["block_commit_time"]
-        block_commit_time = distributions.generate_block_commit_time(
+
+        block_commit_time = distributions.generate_block_commit_time_batch(
             block_size,
-            block_commit_config["crypto_overhead_factor"],
-            block_commit_config["base"],
-            block_commit_config["block_size_sensitivity"]
+            self._commit_overhead_factor,
+            self._commit_base,
+            self._commit_size_sensitivity,
+            rng=self._rng
         )
-        
-        # Generate cryptographic timing metrics
-        sig_gen_time = distributions.generate_sig_gen_time(self.crypto_mode)
-        sig_verify_time = distributions.generate_sig_verify_time(self.crypto_mode)
-        
-        # Assemble complete sample
-        sample = {
-            "timestamp": timestamp,
-            "crypto_mode": self.crypto_mode_name,
-            "load_profile": self.load_profile_name,
-            "run_id": self.run_id,
+
+        sig_gen_time = distributions.generate_sig_gen_time_batch(self.crypto_mode, n, rng=self._rng)
+        sig_verify_time = distributions.generate_sig_verify_time_batch(self.crypto_mode, n, rng=self._rng)
+
+        return {
+            "timestamp": timestamps,
             "tx_rate": tx_rate,
             "latency_avg": latency_avg,
             "latency_p95": latency_p95,
@@ -171,32 +280,103 @@ class BenchmarkSampler:
             "sig_gen_time": sig_gen_time,
             "sig_verify_time": sig_verify_time,
         }
-        
-        return sample
+
+    def _assemble_sample(self, metrics: Dict[str, np.ndarray], i: int) -> Dict[str, Any]:
+        """Materialize row `i` of the metric arrays as a plain sample dict."""
+        return {
+            "timestamp": float(metrics["timestamp"][i]),
+            "crypto_mode": self.crypto_mode_name,
+            "load_profile": self.load_profile_name,
+            "run_id": self.run_id,
+            "tx_rate": float(metrics["tx_rate"][i]),
+            "latency_avg": float(metrics["latency_avg"][i]),
+            "latency_p95": float(metrics["latency_p95"][i]),
+            "cpu_util": float(metrics["cpu_util"][i]),
+            "mem_util": float(metrics["mem_util"][i]),
+            "block_size": int(metrics["block_size"][i]),
+            "block_commit_time": float(metrics["block_commit_time"][i]),
+            "sig_gen_time": float(metrics["sig_gen_time"][i]),
+            "sig_verify_time": float(metrics["sig_verify_time"][i]),
+        }
     
-    def generate_samples(self, num_samples: int) -> List[Dict[str, Any]]:
+    def generate_samples_array(self, num_samples: int) -> np.ndarray:
         """
-        Generate multiple data samples (multiple CSV rows).
-        
+        Generate multiple samples as a single structured NumPy array.
+
+        Same data as generate_samples, but laid out column-wise
+        (SAMPLE_DTYPE) without per-row dict allocation — the preferred
+        form for bulk export and analysis.
+
         Args:
             num_samples: Number of samples to generate
-        
+
         Returns:
-            List of sample dictionaries
-            
-        Example:
-            >>> sampler = BenchmarkSampler(config, "ECDSA", "LOWLOAD", "RUN1")
-            >>> samples = sampler.generate_samples(300)  # 5 minutes at 1 sample/sec
-            >>> len(samples)
-            300
+            Structured array of shape (num_samples,) with SAMPLE_DTYPE
         """
-        samples = []
-        for i in range(num_samples):
-            sample = self.generate_sample(i)
-            samples.append(sample)
-        
-        return samples
-    
+        metrics = self._draw_metric_arrays(num_samples)
+        out = np.empty(num_samples, dtype=SAMPLE_DTYPE)
+        out["crypto_mode"] = self.crypto_mode_name
+        out["load_profile"] = self.load_profile_name
+        out["run_id"] = self.run_id
+        for name, values in metrics.items():
+            out[name] = values
+        return out
+
+    def generate_samples_iter(self, num_samples: int, chunk_size: int = 8192):
+        """
+        Yield samples one dict at a time, drawing in vectorized chunks.
+
+        Keeps steady-state memory at one chunk of metric arrays instead
+        of the full run, so generation can overlap with a streaming
+        export. Timestamps stay continuous across chunks.
+
+        Args:
+            num_samples: Total number of samples to yield
+            chunk_size: Rows drawn per vectorized batch
+
+        Yields:
+            Sample dictionaries, identical to generate_samples output
+        """
+        start_timestamp = self.start_timestamp
+        try:
+            for offset in range(0, num_samples, chunk_size):
+                n = min(chunk_size, num_samples - offset)
+                self.start_timestamp = (
+                    start_timestamp + offset * self.sampling_interval
+                )
+                metrics = self._draw_metric_arrays(n)
+                for i in range(n):
+                    yield self._assemble_sample(metrics, i)
+        finally:
+            self.start_timestamp = start_timestamp
+
+    def generate_samples_columns(self, num_samples: int) -> Dict[str, np.ndarray]:
+        """
+        Generate multiple samples as a dict of one array per column.
+
+        Columnar counterpart of generate_samples: the metric arrays come
+        straight from the vectorized draws with no per-row assembly, and
+        the constant identity columns are broadcast once.
+
+        Args:
+            num_samples: Number of samples to generate
+
+        Returns:
+            Dict mapping each output column to an array of length num_samples
+        """
+        metrics = self._draw_metric_arrays(num_samples)
+        columns = {"timestamp": metrics["timestamp"]}
+        for name, constant in (
+            ("crypto_mode", self.crypto_mode_name),
+            ("load_profile", self.load_profile_name),
+            ("run_id", self.run_id),
+        ):
+            columns[name] = np.full(num_samples, constant, dtype=SAMPLE_DTYPE[name])
+        for name in metrics:
+            if name != "timestamp":
+                columns[name] = metrics[name]
+        return columns
+
     def get_column_order(self) -> List[str]:
         """
         Get the correct column order from config.
@@ -233,17 +413,59 @@ class BenchmarkSampler:
             if not (0 <= sample["mem_util"] <= 100):
                 return False
             
-            # Check all columns present
-            required_columns = self.get_column_order()
-            for col in required_columns:
-                if col not in sample:
-                    return False
-            
-            return True
+            # Check all columns present (single set comparison)
+            return sample.keys() >= self._columns_frozen
         
         except (KeyError, TypeError):
             return False
 
+    def validate_batch(self, columns: Dict[str, np.ndarray]) -> bool:
+        """
+        Validate a whole columnar batch with vectorized checks.
+
+        Batch counterpart of validate_sample: the same consistency rules
+        applied as a handful of NumPy reductions instead of per-row
+        Python comparisons.
+
+        Args:
+            columns: Dict of column arrays (generate_samples_columns
+                output, or a structured array's fields)
+
+        Returns:
+            True if every row is valid, False otherwise
+        """
+        try:
+            if not (columns.keys() >= self._columns_frozen):
+                return False
+            cpu = columns["cpu_util"]
+            mem = columns["mem_util"]
+            return bool(
+                np.all(columns["latency_p95"] > columns["latency_avg"])
+                and np.all((cpu >= 0) & (cpu <= 100))
+                and np.all((mem >= 0) & (mem <= 100))
+            )
+        except (KeyError, TypeError):
+            return False
+
+
+def _generate_run_worker(
+    config: Dict[str, Any],
+    crypto_mode_name: str,
+    load_profile_name: str,
+    run_number: int,
+    seed_seq: np.random.SeedSequence,
+    num_samples: int
+) -> List[Dict[str, Any]]:
+    """Generate one run's samples; top-level so it is picklable for process pools."""
+    sampler = BenchmarkSampler(
+        config,
+        crypto_mode_name,
+        load_profile_name,
+        f"RUN{run_number}",
+        rng=np.random.default_rng(seed_seq)
+    )
+    return sampler.generate_samples(num_samples)
+
 
 class MultiRunSampler:
     """
@@ -259,7 +481,8 @@ class MultiRunSampler:
         config: Dict[str, Any],
         crypto_mode_name: str,
         load_profile_name: str,
-        num_runs: int = 3
+        num_runs: int = 3,
+        seed: Optional[int] = None
     ):
         """
         Initialize multi-run sampler.
@@ -269,11 +492,19 @@ class MultiRunSampler:
             crypto_mode_name: Crypto mode name
             load_profile_name: Load profile name
             num_runs: Number of runs to generate (default: 3)
+            seed: Base seed (int or a pre-spawned SeedSequence); each
+                run gets an independent spawned stream
         """
         self.config = config
         self.crypto_mode_name = crypto_mode_name
         self.load_profile_name = load_profile_name
         self.num_runs = num_runs
+        # SeedSequence gives statistically independent child streams per run,
+        # which also makes the runs safe to generate concurrently. Callers
+        # sweeping many configurations hand in a spawned child directly.
+        self._seed_seq = (seed if isinstance(seed, np.random.SeedSequence)
+                          else np.random.SeedSequence(seed))
+        self._run_seeds = self._seed_seq.spawn(num_runs)
     
     def generate_run(self, run_number: int, num_samples: int) -> List[Dict[str, Any]]:
         """
@@ -288,23 +519,48 @@ class MultiRunSampler:
         """
         run_id = f"RUN{run_number}"
         
-        # Create sampler for this run
+        # Create sampler for this run, with its own RNG stream
         sampler = BenchmarkSampler(
             self.config,
             self.crypto_mode_name,
             self.load_profile_name,
-            run_id
+            run_id,
+            rng=np.random.default_rng(self._run_seeds[run_number - 1])
         )
         
         # Generate samples
         return sampler.generate_samples(num_samples)
     
-    def generate_all_runs(self, num_samples_per_run: int) -> Dict[str, List[Dict[str, Any]]]:
+    def iter_runs(self, num_samples_per_run: int) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        Yield (run_number, samples) for each run, one run at a time.
+
+        Lazy counterpart of generate_all_runs: a run's samples exist
+        only while the consumer holds them, so callers that export
+        run-by-run keep one run in memory instead of the whole set.
+
+        Args:
+            num_samples_per_run: Number of samples per run
+
+        Yields:
+            Tuples of (run_number, list of samples)
+        """
+        for run_number in range(1, self.num_runs + 1):
+            yield run_number, self.generate_run(run_number, num_samples_per_run)
+
+    def generate_all_runs(
+        self,
+        num_samples_per_run: int,
+        use_processes: bool = False
+    ) -> Dict[str, List[Dict[str, Any]]]:
         """
         Generate samples for all runs.
         
         Args:
             num_samples_per_run: Number of samples per run
+            use_processes: Fan runs out to worker processes instead of
+                threads (worth it only for very large runs, where the
+                pickling cost is amortized)
         
         Returns:
             Dictionary mapping run_id to list of samples
@@ -314,15 +570,89 @@ class MultiRunSampler:
             >>> all_data = multi_sampler.generate_all_runs(300)
             >>> all_data.keys()
             dict_keys(['RUN1', 'RUN2', 'RUN3'])
+
+        Note:
+            Runs draw from independent RNG streams, so they are generated
+            concurrently (NumPy releases the GIL during the batch draws).
         """
-        all_runs = {}
-        
-        for run_num in range(1, self.num_runs + 1):
-            run_id = f"RUN{run_num}"
-            samples = self.generate_run(run_num, num_samples_per_run)
-            all_runs[run_id] = samples
-        
-        return all_runs
+        run_numbers = range(1, self.num_runs + 1)
+        if self.num_runs == 1:
+            return {"RUN1": self.generate_run(1, num_samples_per_run)}
+
+        executor_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        max_workers = min(self.num_runs, os.cpu_count() or 1)
+        with executor_cls(max_workers=max_workers) as pool:
+            results = pool.map(
+                _generate_run_worker,
+                repeat(self.config),
+                repeat(self.crypto_mode_name),
+                repeat(self.load_profile_name),
+                run_numbers,
+                self._run_seeds,
+                repeat(num_samples_per_run)
+            )
+            return {f"RUN{run_num}": samples
+                    for run_num, samples in zip(run_numbers, results)}
+
+
+def generate_grid(
+    config: Dict[str, Any],
+    crypto_modes: List[str],
+    load_profiles: List[str],
+    runs_per_config: int = 3,
+    num_samples_per_run: int = 300,
+    seed: Optional[int] = None,
+    use_processes: bool = False
+) -> Dict[tuple, Dict[str, List[Dict[str, Any]]]]:
+    """
+    Generate every (crypto_mode, load_profile, run) combination in one pool.
+
+    MultiRunSampler parallelizes runs within a single configuration;
+    callers sweeping the whole experiment matrix were still looping
+    configurations serially. This flattens the full Cartesian product
+    into one task list so a single pool keeps every core busy even when
+    runs_per_config is small.
+
+    Args:
+        config: Configuration dictionary
+        crypto_modes: Crypto mode names to sweep
+        load_profiles: Load profile names to sweep
+        runs_per_config: Runs per (mode, profile) combination
+        num_samples_per_run: Samples per run
+        seed: Base seed; every task gets an independent spawned stream
+        use_processes: Use worker processes instead of threads
+
+    Returns:
+        Dict mapping (crypto_mode, load_profile) to {run_id: samples}
+    """
+    tasks = [
+        (mode, profile, run_number)
+        for mode in crypto_modes
+        for profile in load_profiles
+        for run_number in range(1, runs_per_config + 1)
+    ]
+    task_seeds = np.random.SeedSequence(seed).spawn(len(tasks))
+
+    executor_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    max_workers = min(len(tasks), os.cpu_count() or 1)
+    # Chunked map amortizes pickling when tasks far outnumber workers
+    # (ThreadPoolExecutor simply ignores chunksize).
+    chunksize = max(1, len(tasks) // (4 * max_workers))
+    with executor_cls(max_workers=max_workers) as pool:
+        results = pool.map(
+            _generate_run_worker,
+            repeat(config),
+            [t[0] for t in tasks],
+            [t[1] for t in tasks],
+            [t[2] for t in tasks],
+            task_seeds,
+            repeat(num_samples_per_run),
+            chunksize=chunksize
+        )
+        grid: Dict[tuple, Dict[str, List[Dict[str, Any]]]] = {}
+        for (mode, profile, run_number), samples in zip(tasks, results):
+            grid.setdefault((mode, profile), {})[f"RUN{run_number}"] = samples
+        return grid
 
 
 # ==============================================================================
@@ -358,4 +688,6 @@ __all__ = [
     "BenchmarkSampler",
     "MultiRunSampler",
     "create_sampler_from_config",
+    "generate_grid",
+    "SAMPLE_DTYPE",
 ]
\ No newline at end of file
@@ -0,0 +1,12 @@
+"""
+Shared utilities for the data generation package.
+
+Modules:
+    - validators: Input validation helpers
+    - random_utils: Seeded RNG management
+    - numba_utils: Optional Numba JIT support
+    - csv_utils: CSV export machinery
+
+The __init__ also makes this directory a regular package so
+find_packages() includes it in built distributions.
+"""
@@ -0,0 +1,29 @@
+# ==============================================================================
+# UTILITY FUNCTIONS
+# ==============================================================================
+
+"""
+Optional Numba support.
+
+Numba is an optional dependency: when it is installed, `njit`/`prange`
+are the real decorators; otherwise they degrade to no-ops so decorated
+functions run as plain Python. Callers that need a different fallback
+implementation can branch on HAS_NUMBA.
+"""
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(fn):
+            return fn
+        return wrap
+
+    prange = range
@@ -4,12 +4,33 @@
 
 import random
 
-def set_random_seed(seed: int = None) -> None:
+import numpy as np
+
+# Module-level NumPy generator used by the vectorized batch distributions.
+_rng = np.random.default_rng()
+
+
+def set_random_seed(seed: int = None) -> np.random.Generator:
     """
     Set random seed for reproducibility.
-    
+
+    Seeds both the stdlib `random` module (scalar distributions) and the
+    NumPy generator (batch distributions). With seed=None both are
+    re-seeded from OS entropy.
+
     Args:
         seed: Random seed (None = truly random)
+
+    Returns:
+        The new shared NumPy Generator (PCG64), so callers can also keep
+        a direct reference for per-worker use.
     """
-    if seed is not None:
-        random.seed(seed)
\ No newline at end of file
+    global _rng
+    random.seed(seed)
+    _rng = np.random.default_rng(seed)
+    return _rng
+
+
+def get_rng() -> np.random.Generator:
+    """Return the shared NumPy random generator."""
+    return _rng
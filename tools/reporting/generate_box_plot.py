@@ -8,6 +8,7 @@ Usage:
 """
 import argparse
 import glob
+from dataclasses import replace
 from pathlib import Path
 from .utils.data_aggregator import DataAggregator
 from .utils.plot_config import create_metric_config
@@ -22,6 +23,7 @@ def parse_args():
     parser.add_argument('--title', help='Custom plot title')
     parser.add_argument('--fontsize', type=int, default=14, help='Font size for labels (default: 14)')
     parser.add_argument('--title-fontsize', type=int, default=16, help='Font size for title (default: 16)')
+    parser.add_argument('--dpi', type=int, default=300, help='Output resolution in DPI (default: 300)')
     return parser.parse_args()
 
 def expand_paths(patterns):
@@ -48,15 +50,15 @@ def main():
     print(f"Box Plot Generator - {args.metric}")
     print(f"{'='*60}\n")
     
-    # Load and aggregate data
+    # Load and aggregate data (only the columns this plot needs)
     aggregator = DataAggregator(csv_files)
-    aggregator.load_all()
+    aggregator.load_all(usecols=['crypto_mode', 'load_profile', args.metric])
     grouped_data = aggregator.get_grouped_data(args.metric)
     
-    # Create plot configuration
+    # Create plot configuration (shared frozen instance per metric)
     config = create_metric_config(args.metric)
     if args.title:
-        config.title = args.title
+        config = replace(config, title=args.title)
     
     # Generate and save plot with custom font sizes
     plotter = BoxPlotter(config)
@@ -65,7 +67,7 @@ def main():
         fontsize=args.fontsize,
         title_fontsize=args.title_fontsize
     )
-    plotter.save(Path(args.output))
+    plotter.save(Path(args.output), dpi=args.dpi)
     
     print(f"\n{'='*60}")
     print("✓ Completed successfully")
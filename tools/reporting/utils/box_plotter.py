@@ -1,8 +1,33 @@
-import matplotlib.pyplot as plt
 import matplotlib
+matplotlib.use('Agg')  # Headless backend; skips GUI event-loop setup
+import matplotlib.pyplot as plt
 import numpy as np
 from pathlib import Path
 
+from .figure_cache import get_axes
+
+# Last (fontsize, title_fontsize) pushed into rcParams. Updating
+# rcParams invalidates matplotlib's font caches, so skip the update
+# entirely when successive plots reuse the same sizes.
+_applied_fonts = None
+
+
+def _apply_font_sizes(fontsize, title_fontsize):
+    global _applied_fonts
+    if _applied_fonts == (fontsize, title_fontsize):
+        return
+    matplotlib.rcParams.update({
+        'font.size': fontsize,
+        'axes.labelsize': fontsize,
+        'axes.titlesize': title_fontsize,
+        'xtick.labelsize': fontsize,
+        'ytick.labelsize': fontsize,
+        'legend.fontsize': fontsize,
+        'figure.titlesize': title_fontsize
+    })
+    _applied_fonts = (fontsize, title_fontsize)
+
+
 class BoxPlotter:
     """Creates and saves box plots with configurable styling."""
     
@@ -24,24 +49,17 @@ class BoxPlotter:
         if not grouped_data:
             raise ValueError("No data provided for plotting")
         
-        # Set global font size
-        matplotlib.rcParams.update({
-            'font.size': fontsize,
-            'axes.labelsize': fontsize,
-            'axes.titlesize': title_fontsize,
-            'xtick.labelsize': fontsize,
-            'ytick.labelsize': fontsize,
-            'legend.fontsize': fontsize,
-            'figure.titlesize': title_fontsize
-        })
-        
-        # Create figure with larger size for better readability
-        self.fig, self.ax = plt.subplots(figsize=(12, 7))
-        
-        # Prepare data - ensure we have numpy arrays
-        labels = []
-        data = []
+        # Set global font size (no-op when unchanged since the last plot)
+        _apply_font_sizes(fontsize, title_fontsize)
         
+        # Reuse the cached figure for this size; axes come back cleared
+        self.fig, self.ax = get_axes((12, 7))
+        
+        # Prepare data. Shape/dtype checks stay per group (they touch
+        # metadata only); the NaN filtering runs as one scan over a
+        # single concatenated array instead of one np.isnan pass per
+        # group, then np.split recovers the per-group views.
+        arrays = []
         for label, values in grouped_data.items():
             # Convert to numpy array if needed
             if not isinstance(values, np.ndarray):
@@ -55,7 +73,7 @@ class BoxPlotter:
             
             # Flatten if multi-dimensional
             if values.ndim > 1:
-                values = values.flatten()
+                values = values.ravel()
             
             # Validate data type
             if values.dtype == 'object':
@@ -64,9 +82,22 @@ class BoxPlotter:
                     print(f"  Sample values: {values[:min(5, len(values))]}")
                 raise TypeError(f"Non-numeric data in group '{label}'")
             
-            # Remove NaN values
-            values = values[~np.isnan(values)]
-            
+            arrays.append(values)
+        
+        # Single-pass NaN drop across all groups
+        lengths = np.fromiter((a.size for a in arrays), dtype=np.intp,
+                              count=len(arrays))
+        flat = np.concatenate(arrays)
+        codes = np.repeat(np.arange(len(arrays)), lengths)
+        mask = ~np.isnan(flat)
+        flat = flat[mask]
+        codes = codes[mask]
+        kept_lengths = np.bincount(codes, minlength=len(arrays))
+        parts = np.split(flat, np.cumsum(kept_lengths)[:-1])
+        
+        labels = []
+        data = []
+        for label, values in zip(grouped_data, parts):
             if len(values) == 0:
                 print(f"⚠️ Warning: No valid data for '{label}', skipping")
                 continue
@@ -85,17 +116,10 @@ class BoxPlotter:
             'HYBRID': '#87CEEB'      # Light blue
         }
         
-        # Assign colors based on label
-        box_colors = []
-        for label in labels:
-            if 'ECDSA' in label:
-                box_colors.append(colors['ECDSA'])
-            elif 'DILITHIUM3' in label:
-                box_colors.append(colors['DILITHIUM3'])
-            elif 'HYBRID' in label:
-                box_colors.append(colors['HYBRID'])
-            else:
-                box_colors.append('lightblue')
+        # Labels are "MODE\nPROFILE": one dict lookup per box
+        box_colors = [
+            colors.get(label.split('\n', 1)[0], 'lightblue') for label in labels
+        ]
         
         # Create box plot
         bp = self.ax.boxplot(
@@ -125,7 +149,7 @@ class BoxPlotter:
         
         # Rotate x-axis labels if needed
         if len(labels) > 3:
-            plt.xticks(rotation=45, ha='right')
+            plt.setp(self.ax.get_xticklabels(), rotation=45, ha='right')
         
         # Add grid for better readability
         self.ax.yaxis.grid(True, linestyle='--', alpha=0.3, linewidth=0.8)
@@ -135,7 +159,7 @@ class BoxPlotter:
         self.ax.set_facecolor('#F8F8F8')
         
         # Tight layout to prevent label cutoff
-        plt.tight_layout()
+        self.fig.tight_layout()
     
     def save(self, output_path, dpi=300):
         """Save plot to file with high DPI.
@@ -158,4 +182,5 @@ class BoxPlotter:
             edgecolor='none'
         )
         print(f"✓ Plot saved: {output_path}")
-        plt.close(self.fig)
\ No newline at end of file
+        # Figure stays alive in the cache for the next plot; get_axes
+        # clears it before reuse.
\ No newline at end of file
@@ -1,21 +1,87 @@
-"""CSV loading utilities following Single Responsibility Principle."""
+"""CSV loading utilities following Single Responsibility Principle.
 
-import pandas as pd
+pandas and pyarrow are imported lazily on first load: importing this
+module (e.g. for OutputManager-only users) stays essentially free.
+"""
+
+import hashlib
+import json
+import logging
+import os
 import sys
+import tempfile
 from pathlib import Path
 
+from .file_utils import IO_BUFSIZE
+
+_log = logging.getLogger(__name__)
+
+_pd = None          # cached pandas module
+_has_pyarrow = None  # tri-state: None = not probed yet
+
+
+def _pandas():
+    """Import pandas on first use and cache the module."""
+    global _pd
+    if _pd is None:
+        import pandas as pd
+        _pd = pd
+    return _pd
+
+
+def _pyarrow_available() -> bool:
+    """Probe for pyarrow once, on first use."""
+    global _has_pyarrow
+    if _has_pyarrow is None:
+        try:
+            import pyarrow.csv   # noqa: F401
+            import pyarrow.parquet  # noqa: F401
+            _has_pyarrow = True
+        except ImportError:
+            _has_pyarrow = False
+    return _has_pyarrow
+
 
 class CSVLoader:
     """Responsible for loading and validating CSV files."""
-    
-    def __init__(self, csv_path: str):
+
+    # In-process memo of parsed frames, shared across loader instances.
+    # Keyed by (path, mtime, size) like the Parquet sidecar cache, so a
+    # report run invoking several generators on the same CSVs parses
+    # each file at most once per process. Bounded FIFO eviction.
+    _MEM_CACHE = {}
+    _MEM_CACHE_MAX = 32
+
+    def __init__(self, csv_path: str, schema=None, use_cache: bool = True):
         self.csv_path = Path(csv_path)
+        self.schema = schema  # Optional {column_name: pyarrow.DataType} mapping
+        self.use_cache = use_cache
         self._df = None
-    
-    def load(self) -> pd.DataFrame:
+
+    def load(self) -> "pd.DataFrame":
         """Load CSV file and return DataFrame."""
+        use_cache = self.use_cache and _pyarrow_available()
         try:
-            self._df = pd.read_csv(self.csv_path)
+            mem_key = self._cache_key() if self.use_cache else None
+            if mem_key is not None and mem_key in self._MEM_CACHE:
+                self._df = self._MEM_CACHE[mem_key]
+                self._print_info()
+                return self._df
+            cached = self._read_cache() if use_cache else None
+            if cached is not None:
+                self._df = cached
+            elif _pyarrow_available():
+                self._df = self._load_with_arrow()
+            else:
+                self._df = self._load_with_pandas()
+            if cached is None:
+                self._write_schema_sidecar(self._df)
+                if use_cache:
+                    self._write_cache(self._df)
+            if mem_key is not None:
+                if len(self._MEM_CACHE) >= self._MEM_CACHE_MAX:
+                    self._MEM_CACHE.pop(next(iter(self._MEM_CACHE)))
+                self._MEM_CACHE[mem_key] = self._df
             self._print_info()
             return self._df
         except FileNotFoundError:
@@ -24,9 +90,148 @@ class CSVLoader:
         except Exception as e:
             print(f"✗ Error loading CSV: {e}")
             sys.exit(1)
-    
-    def _print_info(self):
-        """Print basic information about loaded data."""
-        print(f"✓ Loaded CSV: {self.csv_path}")
-        print(f"  Shape: {self._df.shape}")
-        print(f"  Columns: {list(self._df.columns)}")
\ No newline at end of file
+
+    def _cache_key(self) -> str:
+        """Identity of the current CSV contents: (resolved path, mtime, size)."""
+        st = self.csv_path.stat()
+        return f"{self.csv_path.resolve()}|{st.st_mtime_ns}|{st.st_size}"
+
+    def _cache_path(self) -> Path:
+        """Cache file keyed by the same content identity as the memo."""
+        key = hashlib.blake2b(self._cache_key().encode()).hexdigest()[:16]
+        return Path(tempfile.gettempdir()) / f"csvloader_{key}.parquet"
+
+    def _read_cache(self):
+        """Return the cached DataFrame for the current CSV, or None."""
+        try:
+            cache = self._cache_path()
+            if cache.exists():
+                return _pandas().read_parquet(cache, engine="pyarrow")
+        except Exception:
+            pass  # stale/corrupt cache: fall through to a fresh parse
+        return None
+
+    def _write_cache(self, df) -> None:
+        """Store the parsed DataFrame as Parquet (atomic rename for safety)."""
+        try:
+            cache = self._cache_path()
+            tmp = cache.with_suffix(f".{os.getpid()}.tmp")
+            df.to_parquet(tmp, engine="pyarrow")
+            os.replace(tmp, cache)
+        except Exception:
+            pass  # caching is best-effort; never fail the load
+
+    def _schema_sidecar(self) -> Path:
+        return self.csv_path.with_suffix(".schema.json")
+
+    def _read_schema_sidecar(self):
+        """Return the cached {column: dtype string} mapping, or None if stale."""
+        try:
+            sidecar = self._schema_sidecar()
+            if sidecar.stat().st_mtime >= self.csv_path.stat().st_mtime:
+                return json.loads(sidecar.read_bytes())
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def _write_schema_sidecar(self, df) -> None:
+        """Persist inferred column dtypes so later loads skip inference."""
+        try:
+            self._schema_sidecar().write_text(
+                json.dumps({col: str(df[col].dtype) for col in df.columns})
+            )
+        except OSError:
+            pass  # read-only location: sidecar is best-effort
+
+    def _arrow_column_types(self):
+        """Explicit schema if given, else one rebuilt from the dtype sidecar."""
+        if self.schema is not None:
+            return self.schema
+        cached = self._read_schema_sidecar()
+        if not cached:
+            return None
+        import numpy as np
+        import pyarrow as pa
+        try:
+            return {
+                col: pa.string() if dtype == "object" else pa.from_numpy_dtype(np.dtype(dtype))
+                for col, dtype in cached.items()
+            }
+        except (TypeError, pa.ArrowNotImplementedError):
+            return None
+
+    def _load_with_arrow(self) -> "pd.DataFrame":
+        """Load via pyarrow's multithreaded C++ CSV parser.
+
+        An explicit schema (or the dtype sidecar from a previous load)
+        skips Arrow's type inference pass. Falls back to pandas when Arrow
+        cannot parse the file.
+        """
+        import pyarrow.csv as pa_csv
+        try:
+            table = pa_csv.read_csv(
+                self.csv_path,
+                read_options=pa_csv.ReadOptions(block_size=8 << 20, use_threads=True),
+                convert_options=pa_csv.ConvertOptions(column_types=self._arrow_column_types()),
+            )
+            return table.to_pandas(self_destruct=True)
+        except FileNotFoundError:
+            raise
+        except Exception:
+            # Arrow is stricter than pandas (e.g. ragged rows); retry with pandas
+            return self._load_with_pandas()
+
+    def _load_with_pandas(self) -> "pd.DataFrame":
+        """pandas fallback, reading through a large explicit buffer."""
+        dtype = self._read_schema_sidecar()
+        with open(self.csv_path, "rb", buffering=IO_BUFSIZE) as fh:
+            return _pandas().read_csv(fh, engine="c", low_memory=False, dtype=dtype)
+
+    def load_chunks(self, chunksize: int = None):
+        """Yield the CSV as successive DataFrame chunks.
+
+        Bounds peak memory to one chunk, allowing files larger than RAM.
+        Chunk size defaults to the CSVLOADER_CHUNK env var or 500_000 rows.
+        """
+        if chunksize is None:
+            chunksize = int(os.environ.get("CSVLOADER_CHUNK", 500_000))
+        try:
+            with _pandas().read_csv(self.csv_path, chunksize=chunksize, engine="c") as reader:
+                yield from reader
+        except FileNotFoundError:
+            print(f"✗ Error: File not found: {self.csv_path}")
+            sys.exit(1)
+
+    def reduce(self, fn, init):
+        """Fold fn over chunks: fn(accumulator, chunk) -> accumulator."""
+        acc = init
+        for chunk in self.load_chunks():
+            acc = fn(acc, chunk)
+        return acc
+
+    def from_parquet(self, parquet_path: str = None) -> "pd.DataFrame":
+        """Load a Parquet file instead (much faster for repeat loads).
+
+        Defaults to the CSV path with a .parquet suffix.
+        """
+        path = Path(parquet_path) if parquet_path else self.csv_path.with_suffix(".parquet")
+        try:
+            if _pyarrow_available():
+                import pyarrow.parquet as pq
+                self._df = pq.read_table(path).to_pandas()
+            else:
+                self._df = _pandas().read_parquet(path)
+            self._print_info(path)
+            return self._df
+        except FileNotFoundError:
+            print(f"✗ Error: File not found: {path}")
+            sys.exit(1)
+        except Exception as e:
+            print(f"✗ Error loading Parquet: {e}")
+            sys.exit(1)
+
+    def _print_info(self, path: Path = None):
+        """Log basic information about loaded data."""
+        # Lazy %-args: formatting is skipped entirely unless DEBUG is enabled
+        _log.debug("Loaded: %s shape=%s columns=%s",
+                   path or self.csv_path, self._df.shape, list(self._df.columns))
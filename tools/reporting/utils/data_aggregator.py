@@ -1,23 +1,56 @@
+from collections import defaultdict
+from pathlib import Path
+
 import pandas as pd
 import numpy as np
 
+try:
+    import pyarrow.parquet as pa_parquet
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+# Group keys are low-cardinality strings; category dtype turns them into
+# small int codes for every downstream groupby/factorize.
+_KEY_DTYPES = {"crypto_mode": "category", "load_profile": "category"}
+
+
 class DataAggregator:
-    """Aggregates data from multiple CSV files."""
+    """Aggregates data from multiple CSV or Parquet files."""
     
     def __init__(self, csv_files):
-        """Initialize with list of CSV file paths."""
+        """Initialize with list of CSV/Parquet file paths."""
         self.csv_files = csv_files
         self.dataframes = []
     
-    def load_all(self):
-        """Load all CSV files into dataframes."""
+    def load_all(self, usecols=None):
+        """Load all input files into dataframes.
+
+        Args:
+            usecols: Optional column projection (e.g. the group keys plus
+                the one metric being plotted). Skipping unused columns
+                drops both parse time and memory proportionally.
+        """
         for csv_file in self.csv_files:
             try:
-                df = pd.read_csv(csv_file)
+                df = self._load_one(csv_file, usecols)
                 self.dataframes.append(df)
                 print(f"✓ Loaded: {csv_file} ({len(df)} rows)")
             except Exception as e:
                 print(f"✗ Error loading {csv_file}: {e}")
+
+    @staticmethod
+    def _load_one(path, usecols=None):
+        """Load one file, accepting .parquet transparently next to .csv."""
+        if Path(path).suffix == ".parquet" and _HAS_PYARROW:
+            return pa_parquet.read_table(path, columns=usecols).to_pandas()
+        # Metric columns are parsed straight to float32: plot-resolution
+        # precision at half the memory of the float64 default.
+        dtypes = dict(_KEY_DTYPES)
+        for col in usecols or ():
+            if col not in dtypes:
+                dtypes[col] = np.float32
+        return pd.read_csv(path, usecols=usecols, dtype=dtypes, engine="c")
     
     def get_grouped_data(self, metric):
         """Get data grouped by configuration for box plotting.
@@ -31,57 +64,82 @@ class DataAggregator:
         if not self.dataframes:
             raise ValueError("No data loaded. Call load_all() first.")
         
-        # Concatenate all dataframes
-        combined_df = pd.concat(self.dataframes, ignore_index=True)
+        all_columns = set()
+        total_rows = 0
+        for df in self.dataframes:
+            all_columns.update(df.columns)
+            total_rows += len(df)
         
         print(f"\n📊 Data Summary:")
-        print(f"  Total rows: {len(combined_df)}")
-        print(f"  Columns: {', '.join(combined_df.columns)}")
+        print(f"  Total rows: {total_rows}")
+        print(f"  Columns: {', '.join(sorted(all_columns))}")
         
         # Check if metric exists
-        if metric not in combined_df.columns:
-            available = ', '.join(combined_df.columns)
+        if metric not in all_columns:
+            available = ', '.join(sorted(all_columns))
             raise ValueError(f"Metric '{metric}' not found. Available: {available}")
         
-        # Group by crypto_mode and load_profile
-        grouped_data = {}
-        
         # Check if grouping columns exist
-        if 'crypto_mode' not in combined_df.columns:
+        if 'crypto_mode' not in all_columns:
             raise ValueError("Column 'crypto_mode' not found in data")
-        if 'load_profile' not in combined_df.columns:
+        if 'load_profile' not in all_columns:
             raise ValueError("Column 'load_profile' not found in data")
         
         print(f"\n📈 Grouping by crypto_mode and load_profile:")
         
-        for (crypto_mode, load_profile), group in combined_df.groupby(
-            ['crypto_mode', 'load_profile'], dropna=False
-        ):
-            # Create label
-            label = f"{crypto_mode}\n{load_profile}"
-            
-            # Extract metric values
-            values = group[metric].values
-            
-            # Ensure it's a 1D array
-            if values.ndim == 0:
-                values = np.array([values])
-            elif values.ndim > 1:
-                values = values.flatten()
-            
-            # Convert to float and remove NaN
-            values = values.astype(float)
-            values = values[~np.isnan(values)]
-            
-            if len(values) > 0:
-                grouped_data[label] = values
-                print(f"  ✓ {label:30s}: {len(values):4d} values | "
-                      f"mean={np.mean(values):8.2f} | "
-                      f"std={np.std(values):8.2f}")
-            else:
-                print(f"  ⚠️  {label:30s}: No valid data")
+        # Stream one file at a time: split each frame into per-group
+        # chunks and collect them per label, then concatenate once per
+        # group. Peak memory is one file plus the grouped output, never
+        # a combined copy of every input.
+        chunks = defaultdict(list)
+        for df in self.dataframes:
+            if not {'crypto_mode', 'load_profile', metric} <= set(df.columns):
+                continue
+            for label, group_values in self._split_frame(df, metric):
+                chunks[label].append(group_values)
+        
+        grouped_data = {}
+        for label in sorted(chunks):
+            values = np.concatenate(chunks[label])
+            grouped_data[label] = values
+            print(f"  ✓ {label:30s}: {len(values):4d} values | "
+                  f"mean={np.mean(values):8.2f} | "
+                  f"std={np.std(values):8.2f}")
         
         if not grouped_data:
             raise ValueError("No valid groups found after processing")
         
-        return grouped_data
\ No newline at end of file
+        return grouped_data
+    
+    @staticmethod
+    def _split_frame(df, metric):
+        """Yield (label, values) per group of one frame, in one sort pass.
+        
+        Factorizes both keys into integer codes, drops NaN metric rows
+        once, stable-sorts by code and splits at group boundaries —
+        no per-group boolean mask/copy.
+        """
+        crypto_codes, crypto_uniques = pd.factorize(df['crypto_mode'], sort=True)
+        load_codes, load_uniques = pd.factorize(df['load_profile'], sort=True)
+        codes = crypto_codes.astype(np.int64) * len(load_uniques) + load_codes
+        values = df[metric].to_numpy(dtype=np.float64, copy=True)
+        
+        keep = ~np.isnan(values)
+        values = values[keep]
+        codes = codes[keep]
+        if not len(values):
+            return
+        
+        order = np.argsort(codes, kind='stable')
+        values = values[order]
+        codes = codes[order]
+        
+        boundaries = np.flatnonzero(np.diff(codes)) + 1
+        for group_values, start in zip(
+            np.split(values, boundaries),
+            np.concatenate(([0], boundaries)),
+        ):
+            code = codes[start]
+            crypto_mode = crypto_uniques[code // len(load_uniques)]
+            load_profile = load_uniques[code % len(load_uniques)]
+            yield f"{crypto_mode}\n{load_profile}", group_values
\ No newline at end of file
@@ -0,0 +1,28 @@
+"""Shared Figure/Axes cache for batch plot generation.
+
+Creating a matplotlib Axes is dominated by tick and spine construction
+(tens of milliseconds each). When the reporting pipeline emits many
+plots, reusing one Figure per figsize and clearing its Axes between
+renders skips that setup cost for every plot after the first.
+"""
+import matplotlib
+matplotlib.use('Agg')  # Headless backend; skips GUI event-loop setup
+import matplotlib.pyplot as plt
+
+_FIG_CACHE = {}
+
+
+def get_axes(figsize):
+    """Return a (fig, ax) pair for this figsize, cleared and ready to draw.
+
+    The pair is cached per figsize and reused across calls; callers must
+    not close the returned figure after saving.
+    """
+    figsize = tuple(figsize)
+    cached = _FIG_CACHE.get(figsize)
+    if cached is None:
+        cached = plt.subplots(figsize=figsize)
+        _FIG_CACHE[figsize] = cached
+    else:
+        cached[1].clear()
+    return cached
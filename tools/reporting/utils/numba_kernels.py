@@ -0,0 +1,164 @@
+"""Optional Numba kernels for report aggregation.
+
+Numba is an optional dependency (same policy as the data-generation
+tools): when it is installed the grouped-moment reduction runs as a
+single compiled loop over the factorized codes, with no sort or
+per-group take. Without it, a NumPy sort + reduceat fallback computes
+the identical result. ``cache=True`` persists the compiled kernel on
+disk so repeated report runs in CI skip the JIT cost.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def _group_moments_numpy(codes, gen, verify, n_groups):
+    """Sort + reduceat fallback; one pass per moment column."""
+    order = np.argsort(codes, kind='stable')
+    codes = codes[order]
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(codes)) + 1))
+    counts = np.zeros(n_groups, dtype=np.float64)
+    out = [counts] + [np.zeros(n_groups, dtype=np.float64) for _ in range(4)]
+    present = codes[starts]
+    counts[present] = np.diff(np.append(starts, len(codes)))
+    gen = np.asarray(gen, dtype=np.float64)[order]
+    verify = np.asarray(verify, dtype=np.float64)[order]
+    for slot, values in ((1, gen), (2, gen * gen), (3, verify), (4, verify * verify)):
+        out[slot][present] = np.add.reduceat(values, starts)
+    return tuple(out)
+
+
+if HAS_NUMBA:
+    @njit(cache=True, nogil=True)
+    def _group_moments_jit(codes, gen, verify, n_groups):  # pragma: no cover
+        counts = np.zeros(n_groups, dtype=np.float64)
+        gen_sum = np.zeros(n_groups, dtype=np.float64)
+        gen_sq = np.zeros(n_groups, dtype=np.float64)
+        verify_sum = np.zeros(n_groups, dtype=np.float64)
+        verify_sq = np.zeros(n_groups, dtype=np.float64)
+        # Serial scatter-accumulate: a parallel prange here would race on
+        # the per-group slots, and one fused pass is already memory-bound.
+        for i in range(codes.shape[0]):
+            c = codes[i]
+            g = np.float64(gen[i])
+            v = np.float64(verify[i])
+            counts[c] += 1.0
+            gen_sum[c] += g
+            gen_sq[c] += g * g
+            verify_sum[c] += v
+            verify_sq[c] += v * v
+        return counts, gen_sum, gen_sq, verify_sum, verify_sq
+
+
+def _curve_stats_numpy(x, y):
+    """Vectorized fallback: same moments via whole-array reductions."""
+    n = x.size
+    x2 = x * x
+    sx, sx2, sx3, sx4 = x.sum(), x2.sum(), (x2 * x).sum(), (x2 * x2).sum()
+    sy, sy2 = y.sum(), (y * y).sum()
+    sxy, sx2y = (x * y).sum(), (x2 * y).sum()
+    coeffs = np.linalg.solve(
+        np.array([[n, sx, sx2], [sx, sx2, sx3], [sx2, sx3, sx4]]),
+        np.array([sy, sxy, sx2y]),
+    )
+    mean_x = sx / n
+    mean_y = sy / n
+    return (
+        x.min(), x.max(),
+        mean_x, np.sqrt(max(sx2 / n - mean_x * mean_x, 0.0)),
+        mean_y, np.sqrt(max(sy2 / n - mean_y * mean_y, 0.0)),
+        coeffs[0], coeffs[1], coeffs[2],
+    )
+
+
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _curve_stats_jit(x, y):  # pragma: no cover
+        n = x.shape[0]
+        x_min = np.float64(x[0])
+        x_max = np.float64(x[0])
+        sx = sx2 = sx3 = sx4 = 0.0
+        sy = sy2 = sxy = sx2y = 0.0
+        for i in range(n):
+            xi = np.float64(x[i])
+            yi = np.float64(y[i])
+            xi2 = xi * xi
+            sx += xi
+            sx2 += xi2
+            sx3 += xi2 * xi
+            sx4 += xi2 * xi2
+            sy += yi
+            sy2 += yi * yi
+            sxy += xi * yi
+            sx2y += xi2 * yi
+            if xi < x_min:
+                x_min = xi
+            elif xi > x_max:
+                x_max = xi
+        # Cramer's rule on the symmetric 3x3 normal-equations system
+        a, b, c = np.float64(n), sx, sx2
+        d, e, f = sx, sx2, sx3
+        g, h, k = sx2, sx3, sx4
+        det = a * (e * k - f * h) - b * (d * k - f * g) + c * (d * h - e * g)
+        c0 = (sy * (e * k - f * h) - b * (sxy * k - f * sx2y)
+              + c * (sxy * h - e * sx2y)) / det
+        c1 = (a * (sxy * k - f * sx2y) - sy * (d * k - f * g)
+              + c * (d * sx2y - sxy * g)) / det
+        c2 = (a * (e * sx2y - sxy * h) - b * (d * sx2y - sxy * g)
+              + sy * (d * h - e * g)) / det
+        mean_x = sx / n
+        mean_y = sy / n
+        return (
+            x_min, x_max,
+            mean_x, np.sqrt(max(sx2 / n - mean_x * mean_x, 0.0)),
+            mean_y, np.sqrt(max(sy2 / n - mean_y * mean_y, 0.0)),
+            c0, c1, c2,
+        )
+
+
+def curve_stats(x, y):
+    """Fused stats + quadratic-fit pass for the performance curve.
+
+    One traversal of (x, y) yields everything the plot annotates:
+    range, means, population stds and the closed-form degree-2 fit.
+
+    Returns:
+        Tuple (x_min, x_max, mean_x, std_x, mean_y, std_y, c0, c1, c2)
+        with the fit coefficients in ascending power order.
+    """
+    if HAS_NUMBA:
+        return _curve_stats_jit(
+            np.ascontiguousarray(x, dtype=np.float64),
+            np.ascontiguousarray(y, dtype=np.float64),
+        )
+    return _curve_stats_numpy(
+        np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+    )
+
+
+def group_moments(codes, gen, verify, n_groups):
+    """Per-group [count, sum, sqsum] for two value columns.
+
+    Args:
+        codes: Dense int group codes (0..n_groups-1), e.g. from pd.factorize
+        gen: First value column (any float dtype)
+        verify: Second value column
+        n_groups: Number of distinct groups
+
+    Returns:
+        Tuple of five float64 arrays of length n_groups:
+        (counts, gen_sum, gen_sqsum, verify_sum, verify_sqsum)
+    """
+    codes = np.ascontiguousarray(codes, dtype=np.int64)
+    if HAS_NUMBA:
+        return _group_moments_jit(
+            codes,
+            np.ascontiguousarray(gen, dtype=np.float64),
+            np.ascontiguousarray(verify, dtype=np.float64),
+            n_groups,
+        )
+    return _group_moments_numpy(codes, gen, verify, n_groups)
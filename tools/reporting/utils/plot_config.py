@@ -1,20 +1,28 @@
 """Plot configuration following Open/Closed Principle."""
 
+import functools
 from dataclasses import dataclass, field
-from typing import Tuple, Dict
+from types import MappingProxyType
+from typing import Mapping, Tuple
 
+# Shared default palette; the read-only proxy lets every config instance
+# reference one dict instead of allocating a copy per construction.
+_DEFAULT_COLORS = MappingProxyType({
+    'ECDSA': '#2ecc71',      # Green
+    'DILITHIUM3': '#e74c3c',  # Red  
+    'HYBRID': '#3498db'       # Blue
+})
 
-@dataclass
+
+@dataclass(frozen=True)
 class BoxPlotConfig:
-    """Configuration for box plot visualization."""
+    """Configuration for box plot visualization (read-only once built)."""
     
     figsize: Tuple[int, int] = (14, 8)
     
-    colors: Dict[str, str] = field(default_factory=lambda: {
-        'ECDSA': '#2ecc71',      # Green
-        'DILITHIUM3': '#e74c3c',  # Red  
-        'HYBRID': '#3498db'       # Blue
-    })
+    # default_factory keeps dataclasses happy about the proxy type but
+    # still hands every instance the same shared mapping
+    colors: Mapping[str, str] = field(default_factory=lambda: _DEFAULT_COLORS)
     
     title: str = "Performance Comparison"
     xlabel: str = "Configuration"
@@ -36,8 +44,13 @@ class BoxPlotConfig:
         return self.colors.get(crypto_mode, '#95a5a6')  # Gray default
 
 
+@functools.lru_cache(maxsize=None)
 def create_metric_config(metric: str) -> BoxPlotConfig:
-    """Create configuration based on metric type."""
+    """Create configuration based on metric type.
+    
+    Configs are frozen, so the instance for each metric is built once
+    and shared; callers needing variations use dataclasses.replace.
+    """
     
     metric_labels = {
         'latency_avg': ('Avg Latency Comparison', 'Configuration', 'Latency (ms)'),